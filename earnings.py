@@ -1,31 +1,473 @@
-
 import streamlit as st
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+import atexit
+import io
+import math
+import os
+import queue
+import re
+from html import escape
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+import httpx
+from curl_cffi import requests as cffi_requests
+from lxml import html as lxml_html
 import yfinance as yf
 import pandas as pd
+import numpy as np
 import logging
+from dotenv import load_dotenv
 
 # Suppress Selenium logging
 logging.getLogger('selenium').setLevel(logging.ERROR)
-logging.getLogger('webdriver_manager').setLevel(logging.ERROR)
+logger = logging.getLogger(__name__)
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Yahoo serves the earnings calendar as server-rendered HTML to browser-like clients
+EARNINGS_CALENDAR_URL = 'https://finance.yahoo.com/calendar/earnings'
+YAHOO_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+# Yahoo's JSON screener API, used when the calendar page comes back without a parseable table
+EARNINGS_API_URL = 'https://query1.finance.yahoo.com/v1/finance/visualization'
+YAHOO_COOKIE_URL = 'https://fc.yahoo.com'
+YAHOO_CRUMB_URL = 'https://query1.finance.yahoo.com/v1/test/getcrumb'
+
+# NASDAQ Trader's daily symbol directory for US exchanges (file -> symbol column)
+LISTED_SYMBOL_FILES = {
+    'https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt': 'Symbol',
+    'https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt': 'ACT Symbol'
+}
+
+# Plain US equity symbols, optionally with a share class (BRK-B, BF.B); filters out warrants, crypto and foreign listings
+TICKER_PATTERN = re.compile(r'^[A-Z]{1,5}([.-][A-Z])?$')
+
+# Calendar pager text, e.g. "1-100 of 347 results"
+TOTAL_RESULTS_PATTERN = re.compile(r'\d[\d,]*\s*-\s*\d[\d,]*\s+of\s+(\d[\d,]*)')
+
+# The same symbol shape, pulled straight out of a /quote/<symbol> link
+QUOTE_LINK_PATTERN = re.compile(r'/quote/([A-Z]{1,5}(?:[.-][A-Z])?)(?:[/?#]|$)', re.IGNORECASE)
+
+# Max dates fetched from Yahoo at the same time
+MAX_CONCURRENT_DATES = 5
+
+# Max calendar pages of one date fetched at the same time
+MAX_CONCURRENT_PAGES = 4
+
+# Optional remote WebDriver endpoint for the browser fallback (e.g. http://localhost:3000/webdriver for Browserless)
+SELENIUM_REMOTE_URL = os.getenv('SELENIUM_REMOTE_URL')
+
+# Max headless Chrome sessions rendering dates at the same time
+MAX_BROWSER_WORKERS = 4
+
+# Max company-info lookups running at the same time
+MAX_INFO_WORKERS = 8
+
+# Every analysis period is sliced out of one download of the longest history
+HISTORY_PERIOD = '5y'
+PERIOD_OFFSETS = {
+    '1mo': pd.DateOffset(months=1),
+    '3mo': pd.DateOffset(months=3),
+    '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1),
+    '2y': pd.DateOffset(years=2),
+    '5y': pd.DateOffset(years=5)
+}
+
+# Tickers per batched price download (one progress update per batch)
+DOWNLOAD_CHUNK_SIZE = 100
+
+# Max concurrent per-ticker requests inside one batched yfinance download
+YF_DOWNLOAD_THREADS = 24
+
+# Per-ticker close history kept on disk for the day ({ticker}_{period}_{YYYYMMDD}.parquet)
+PRICE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.investor_cache')
+
+def parse_earnings_tickers(page_html):
+    """Extract ticker symbols from the earnings table of a calendar page
+    
+    Returns a set of tickers, or None if the page has no earnings table
+    """
+    if not page_html or not page_html.strip():
+        return None
+    
+    tree = lxml_html.fromstring(page_html)
+    
+    for table in tree.iter('table'):
+        # Check if this table has the earnings columns we expect
+        header_texts = table.xpath('.//thead//th//text() | .//thead//td//text()')
+        if not any(keyword in ' '.join(header_texts).lower() for keyword in ['symbol', 'company', 'earnings', 'eps']):
+            continue
+        
+        # Extract tickers from the link in the first cell of each row
+        page_tickers = set()
+        for href in table.xpath('.//tbody/tr/td[1]//a/@href'):
+            # Extract and validate the symbol in one match; junk never costs a yfinance round-trip
+            match = QUOTE_LINK_PATTERN.search(href)
+            if match:
+                page_tickers.add(match.group(1).upper())
+        
+        return page_tickers  # Found the earnings table, stop looking at other tables
+    
+    return None
+
+@st.cache_resource
+def get_yahoo_client():
+    """Shared HTTP/2 client for Yahoo, so calendar pages for every date and rerun reuse warm connections"""
+    limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+    return httpx.Client(http2=True, headers=YAHOO_HEADERS, timeout=20, follow_redirects=True, limits=limits)
+
+def parse_total_results(page_html):
+    """Read the total row count from the calendar's "1-100 of 347 results" pager, or None if it isn't shown"""
+    match = TOTAL_RESULTS_PATTERN.search(page_html)
+    if not match:
+        return None
+    return int(match.group(1).replace(',', ''))
+
+def _fetch_calendar_page(client, specific_date, offset, size):
+    """Fetch one calendar page and return its raw HTML"""
+    response = client.get(
+        EARNINGS_CALENDAR_URL,
+        params={'day': specific_date, 'offset': offset, 'size': size}
+    )
+    response.raise_for_status()
+    return response.text
+
+def fetch_earnings_tickers_http(client, specific_date):
+    """Fetch earnings tickers for a specific date straight from Yahoo's calendar HTML
+    
+    Returns (sorted tickers, complete), or None if Yahoo didn't serve a parseable calendar
+    (e.g. a consent page) so the caller can fall back to the JSON API or the browser.
+    complete is only True when the whole roster was confirmed (pager total, or a clean last page).
+    """
+    size = 100
+    
+    first_page = _fetch_calendar_page(client, specific_date, 0, size)
+    all_tickers = parse_earnings_tickers(first_page)
+    if all_tickers is None:
+        return None
+    
+    # The pager tells us how many rows there are, so fetch every remaining page at once
+    total = parse_total_results(first_page)
+    if total is not None:
+        offsets = range(size, total, size)
+        if offsets:
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_PAGES, len(offsets))) as executor:
+                pages = executor.map(lambda offset: _fetch_calendar_page(client, specific_date, offset, size), offsets)
+                for offset, page in zip(offsets, pages):
+                    page_tickers = parse_earnings_tickers(page)
+                    if page_tickers is None:
+                        # A consent/throttle page mid-roster; a partial list must not be returned (or cached)
+                        raise ValueError(f"Calendar page at offset {offset} for {specific_date} had no earnings table")
+                    all_tickers.update(page_tickers)
+        return sorted(all_tickers), True
+    
+    # No pager: fetch the next pages in concurrent waves until a page adds nothing new
+    max_pages = 10
+    offsets = [page_num * size for page_num in range(1, max_pages)] if all_tickers else []
+    
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as executor:
+        for wave_start in range(0, len(offsets), MAX_CONCURRENT_PAGES):
+            wave = offsets[wave_start:wave_start + MAX_CONCURRENT_PAGES]
+            pages = executor.map(lambda offset: _fetch_calendar_page(client, specific_date, offset, size), wave)
+            
+            # Walk the wave in offset order so the stop point matches a serial walk
+            for page in pages:
+                page_tickers = parse_earnings_tickers(page)
+                if page_tickers is None:
+                    return sorted(all_tickers), False  # No table: the end of the roster, or a consent/throttle page
+                if not page_tickers - all_tickers:
+                    return sorted(all_tickers), True  # Past the last page
+                all_tickers.update(page_tickers)
+    
+    # An empty first page, or every page full up to the page limit: can't tell whether anything is missing
+    return sorted(all_tickers), False
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def get_yahoo_crumb():
+    """Get the session cookie and crumb that Yahoo's JSON APIs require (kept for an hour)"""
+    client = get_yahoo_client()
+    
+    # fc.yahoo.com answers with an error page but sets the session cookie
+    try:
+        client.get(YAHOO_COOKIE_URL)
+    except httpx.HTTPError:
+        pass
+    
+    response = client.get(YAHOO_CRUMB_URL)
+    response.raise_for_status()
+    
+    crumb = response.text.strip()
+    if not crumb or '<' in crumb:
+        raise ValueError("Yahoo did not return a crumb")
+    return crumb
+
+def fetch_earnings_tickers_api(client, specific_date, crumb):
+    """Fetch earnings tickers for a specific date from Yahoo's JSON screener API
+    
+    Returns (sorted tickers, complete); complete is False only if the page limit cut the roster short.
+    """
+    next_date = (datetime.strptime(specific_date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+    all_tickers = set()
+    
+    # Pagination loop
+    offset = 0
+    size = 100
+    max_pages = 10
+    page_num = 0
+    
+    while page_num < max_pages:
+        response = client.post(
+            EARNINGS_API_URL,
+            params={'crumb': crumb, 'lang': 'en-US', 'region': 'US'},
+            json={
+                'entityIdType': 'earnings',
+                'includeFields': ['ticker', 'startdatetime'],
+                'sortField': 'startdatetime',
+                'sortType': 'ASC',
+                'offset': offset,
+                'size': size,
+                'query': {
+                    'operator': 'and',
+                    'operands': [
+                        {'operator': 'gte', 'operands': ['startdatetime', specific_date]},
+                        {'operator': 'lt', 'operands': ['startdatetime', next_date]},
+                        {'operator': 'eq', 'operands': ['region', 'us']}
+                    ]
+                }
+            }
+        )
+        response.raise_for_status()
+        
+        document = response.json()['finance']['result'][0]['documents'][0]
+        ticker_column = [column['id'] for column in document['columns']].index('ticker')
+        rows = document.get('rows', [])
+        
+        for row in rows:
+            ticker = str(row[ticker_column]).upper()
+            if TICKER_PATTERN.match(ticker):
+                all_tickers.add(ticker)
+        
+        if len(rows) < size:
+            return sorted(all_tickers), True  # Last page
+        
+        offset += size
+        page_num += 1
+    
+    return sorted(all_tickers), False
+
+class IncompleteCalendarError(Exception):
+    """A date's roster was fetched but couldn't be confirmed complete, so it mustn't be persisted"""
+    def __init__(self, tickers):
+        super().__init__(f"{len(tickers)} tickers, roster not confirmed complete")
+        self.tickers = tickers
+
+def _fetch_earnings_tickers_for_date(specific_date):
+    """Fetch one date's tickers, raising on failure so the error never ends up in a cache
+    
+    Tries the calendar HTML first, then the JSON API, and only then headless Chrome.
+    Returns (sorted tickers, complete).
+    """
+    client = get_yahoo_client()
+    
+    try:
+        result = fetch_earnings_tickers_http(client, specific_date)
+        if result is not None:
+            return result
+        logger.warning(f"No earnings table in the calendar HTML for {specific_date}, trying the JSON API")
+    except Exception as e:
+        logger.warning(f"Calendar HTML fetch failed for {specific_date}, trying the JSON API: {str(e)}")
+    
+    # Either way (no table, or a 403/429/timeout), try the JSON API before paying for a browser
+    try:
+        return fetch_earnings_tickers_api(client, specific_date, get_yahoo_crumb())
+    except Exception as e:
+        logger.warning(f"JSON API fetch failed for {specific_date}, falling back to browser: {str(e)}")
+    
+    return fetch_earnings_tickers_browser(specific_date)
+
+@st.cache_data(persist='disk', show_spinner=False)
+def _fetch_complete_past_earnings_tickers(specific_date):
+    """Past calendars don't change, so confirmed-complete rosters are persisted on disk across reruns and restarts"""
+    tickers, complete = _fetch_earnings_tickers_for_date(specific_date)
+    if not complete:
+        raise IncompleteCalendarError(tickers)  # Exceptions aren't cached, so this never reaches the disk
+    return tickers
+
+@st.cache_data(ttl=86400, show_spinner=False)  # Cache for 1 day
+def fetch_past_earnings_tickers(specific_date):
+    """Fetch earnings tickers for a date that has already happened
+    
+    Complete rosters come from the permanent disk cache; one that couldn't be confirmed complete is
+    only kept for a day, so a later run gets another chance at the full list.
+    """
+    try:
+        return _fetch_complete_past_earnings_tickers(specific_date)
+    except IncompleteCalendarError as e:
+        logger.warning(f"Earnings roster for {specific_date} may be incomplete; not persisting it")
+        return e.tickers
+
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour
+def fetch_upcoming_earnings_tickers(specific_date):
+    """Fetch earnings tickers for today or a future date
+    
+    These calendars still change as companies schedule reports, so results are only kept for an hour.
+    """
+    tickers, _ = _fetch_earnings_tickers_for_date(specific_date)
+    return tickers
 
-def fetch_earnings_tickers(specific_date):
-    """Fetch earnings tickers for a specific date"""
+def fetch_earnings_tickers_for_dates(dates):
+    """Fetch earnings tickers for several dates concurrently
+    
+    Returns a dict mapping each date to its sorted ticker list.
+    """
+    if not dates:
+        return {}
+    
+    today = datetime.today().strftime('%Y-%m-%d')
+    date_results = {}
+    
+    # Each date is looked up in its cache first; only uncached dates hit Yahoo
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_DATES, len(dates))) as executor:
+        futures = {
+            executor.submit(fetch_past_earnings_tickers if date < today else fetch_upcoming_earnings_tickers, date): date
+            for date in dates
+        }
+        
+        for future in as_completed(futures):
+            date = futures[future]
+            try:
+                date_results[date] = future.result()
+            except Exception as e:
+                st.error(f"Error fetching tickers for {date}: {str(e)}")
+                date_results[date] = []
+    
+    return {date: date_results[date] for date in dates}
+
+def _chrome_options():
+    """Headless Chrome options for the browser fallback"""
     options = Options()
-    options.add_argument("--headless")
+    # The new headless mode shares the regular browser's rendering pipeline and is much faster on Yahoo
+    options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--window-size=1920,1080")
+    # Only the earnings table matters, so skip images, extensions and background traffic
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-background-networking")
+    # No GPU in headless servers, and pooled drivers sit in the background between fetches
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-renderer-backgrounding")
+    options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.stylesheets': 2,
+        'profile.managed_default_content_settings.fonts': 2,
+        'profile.managed_default_content_settings.plugins': 2,
+        'profile.default_content_setting_values.notifications': 2
+    })
+    # Return from driver.get at DOMContentLoaded; the explicit wait covers the table itself
+    options.page_load_strategy = 'eager'
+    return options
+
+@st.cache_resource
+def get_driver_pool():
+    """Pool of headless Chrome drivers for the browser fallback (started lazily, reused across dates and reruns)
+    
+    A WebDriver isn't safe to share between threads, so each fetch checks one out exclusively,
+    and at most MAX_BROWSER_WORKERS can be checked out at once.
+    """
+    pool = {
+        'idle': queue.Queue(),
+        'all': [],
+        'lock': threading.Lock(),
+        'slots': threading.BoundedSemaphore(MAX_BROWSER_WORKERS)
+    }
+    atexit.register(_quit_drivers, pool)
+    return pool
+
+def _checkout_driver():
+    """Take an idle headless Chrome driver from the pool, starting a new one if none is free"""
+    pool = get_driver_pool()
+    pool['slots'].acquire()
+    try:
+        return pool['idle'].get_nowait()
+    except queue.Empty:
+        pass
+    
+    try:
+        if SELENIUM_REMOTE_URL:
+            # A long-running Browserless / Selenium Grid keeps Chrome warm, so no local driver or browser start
+            driver = webdriver.Remote(command_executor=SELENIUM_REMOTE_URL, options=_chrome_options())
+        else:
+            driver = webdriver.Chrome(options=_chrome_options())
+    except Exception:
+        pool['slots'].release()
+        raise
     
+    with pool['lock']:
+        pool['all'].append(driver)
+    return driver
+
+def _checkin_driver(driver):
+    """Return a driver to the pool so the next fetch can reuse it"""
+    # Start the next fetch from a clean session rather than relaunching Chrome
     try:
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        driver.delete_all_cookies()
+    except Exception:
+        _discard_driver(driver)
+        return
+    
+    pool = get_driver_pool()
+    pool['idle'].put(driver)
+    pool['slots'].release()
+
+def _discard_driver(driver):
+    """Shut down a driver whose session may be broken"""
+    pool = get_driver_pool()
+    with pool['lock']:
+        if driver in pool['all']:
+            pool['all'].remove(driver)
+    pool['slots'].release()
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+def _quit_drivers(pool):
+    """Shut down every pooled Chrome driver at exit"""
+    with pool['lock']:
+        drivers = list(pool['all'])
+        pool['all'].clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+def fetch_earnings_tickers_browser(specific_date):
+    """Fetch earnings tickers for a specific date by rendering the page in headless Chrome
+    
+    Slow fallback for when Yahoo won't serve the calendar to a plain HTTP client.
+    Safe to call from worker threads: each call checks out its own driver.
+    Returns (sorted tickers, complete); complete means every page the pager announced was read.
+    """
+    driver = None
+    try:
+        driver = _checkout_driver()
         all_tickers = set()
         
         # Pagination loop
@@ -33,62 +475,42 @@ def fetch_earnings_tickers(specific_date):
         size = 100
         max_pages = 10
         page_num = 0
+        total = None
         
         while page_num < max_pages:
             url = f'https://finance.yahoo.com/calendar/earnings?day={specific_date}&offset={offset}&size={size}'
             
             driver.get(url)
-            time.sleep(4)
             
-            page_tickers = set()
+            # Wait until the earnings rows are rendered instead of sleeping a fixed time
+            try:
+                WebDriverWait(driver, 8, poll_frequency=0.2).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'table tbody tr a[href*="/quote/"]'))
+                )
+            except TimeoutException:
+                if page_num == 0:
+                    # Nothing rendered at all (blocked, consent page, Yahoo down). Fail rather than return an
+                    # empty list that would be cached as "no earnings"; genuinely empty days come back from the API
+                    _checkin_driver(driver)
+                    driver = None
+                    raise RuntimeError(f"Earnings calendar for {specific_date} never rendered in the browser")
+                break  # No earnings rows on this page
             
-            # Look ONLY in the earnings table - be very specific
+            # Pull the rendered page once and parse it locally instead of walking the DOM over the driver
             try:
-                tables = driver.find_elements(By.TAG_NAME, 'table')
-                
-                for table_idx, table in enumerate(tables):
-                    # Check if this table has the earnings columns we expect
-                    try:
-                        headers = table.find_elements(By.CSS_SELECTOR, 'thead th, thead td')
-                        header_texts = [h.text.strip() for h in headers]
-                        
-                        # Look for earnings table markers
-                        if any(keyword in ' '.join(header_texts).lower() for keyword in ['symbol', 'company', 'earnings', 'eps']):
-                            
-                            # Now extract tickers from this specific table
-                            rows = table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-                            
-                            for row in rows:
-                                try:
-                                    cells = row.find_elements(By.TAG_NAME, 'td')
-                                    
-                                    if cells:
-                                        first_cell = cells[0]
-                                        
-                                        # Look for a link in the first cell
-                                        try:
-                                            link = first_cell.find_element(By.TAG_NAME, 'a')
-                                            href = link.get_attribute('href')
-                                            
-                                            # Extract ticker from URL
-                                            if href and '/quote/' in href:
-                                                ticker = href.split('/quote/')[1].split('?')[0].split('/')[0]
-                                                
-                                                # Validate ticker format
-                                                if ticker and 1 <= len(ticker) <= 10:
-                                                    page_tickers.add(ticker.upper())
-                                        except:
-                                            pass
-                                except:
-                                    continue
-                            
-                            break  # Found the earnings table, stop looking at other tables
-                            
-                    except:
-                        continue
+                page_html = driver.page_source
+                page_tickers = parse_earnings_tickers(page_html) or set()
                 
+                # The pager on the first page says exactly how many pages exist, so skip the empty-page probe
+                if page_num == 0:
+                    total = parse_total_results(page_html)
+                    if total is not None:
+                        max_pages = max(1, math.ceil(total / size))
             except Exception as e:
-                st.warning(f"Error on page {page_num + 1} for {specific_date}: {str(e)}")
+                if page_num == 0:
+                    raise  # Same as above: an unreadable first page must not be cached as an empty day
+                logger.warning(f"Error on page {page_num + 1} for {specific_date}: {str(e)}")
+                page_tickers = set()
             
             # Check if we found new tickers on this page
             new_tickers = page_tickers - all_tickers
@@ -100,132 +522,236 @@ def fetch_earnings_tickers(specific_date):
             offset += size
             page_num += 1
         
-        driver.quit()
+        _checkin_driver(driver)
         
-        return sorted(list(all_tickers))
+        # Without a pager a missing row can't be told apart from the end of the list
+        complete = total is not None and page_num >= max_pages
+        return sorted(list(all_tickers)), complete
         
-    except Exception as e:
-        st.error(f"Error fetching tickers for {specific_date}: {str(e)}")
-        if 'driver' in locals():
-            driver.quit()
-        return []
+    except Exception:
+        # Discard the driver in case the session is broken; the next call starts a fresh one
+        if driver is not None:
+            _discard_driver(driver)
+        raise
+
+@st.cache_resource
+def get_yf_session():
+    """Shared browser-impersonating session so every yfinance call reuses warm connections to Yahoo"""
+    return cffi_requests.Session(impersonate='chrome')
+
+def download_closes(tickers, period):
+    """Download closing prices for many tickers in one batched yfinance call
+    
+    Returns a DataFrame with one Close column per ticker (empty if nothing came back)
+    """
+    if not tickers:
+        return pd.DataFrame()
+    
+    # yfinance defaults to 2 threads per CPU; the work is network-bound, so allow more in flight
+    threads = min(YF_DOWNLOAD_THREADS, len(tickers))
+    data = yf.download(list(tickers), period=period, group_by='ticker', threads=threads, progress=False, auto_adjust=True, session=get_yf_session())
+    
+    if data.empty:
+        return pd.DataFrame()
+    
+    # Batched downloads come back with (ticker, field) multi-level columns
+    if isinstance(data.columns, pd.MultiIndex):
+        return data.xs('Close', axis=1, level=1)
+    
+    return data[['Close']].set_axis([tickers[0]], axis=1)
+
+def _price_cache_path(ticker, period, as_of):
+    return os.path.join(PRICE_CACHE_DIR, f"{ticker}_{period}_{as_of:%Y%m%d}.parquet")
+
+def prune_price_cache(as_of):
+    """Delete cached price files from earlier days"""
+    today = f"_{as_of:%Y%m%d}.parquet"
+    try:
+        names = os.listdir(PRICE_CACHE_DIR)
+    except FileNotFoundError:
+        return
+    for name in names:
+        path = os.path.join(PRICE_CACHE_DIR, name)
+        # Also catches temp files left behind by an interrupted write; subdirectories (the SEC cache) are left alone
+        if today not in name and os.path.isfile(path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Another session may have removed it already
+
+def get_closes(tickers, period):
+    """Closing prices for many tickers, reusing today's per-ticker history from disk
+    
+    Only tickers with no cached file for today are downloaded (in one batched call), so tickers seen
+    on an earlier run are reused whatever batch they land in.
+    """
+    as_of = datetime.now().date()
+    cached = {}
+    missing = []
+    for ticker in tickers:
+        path = _price_cache_path(ticker, period, as_of)
+        try:
+            cached[ticker] = pd.read_parquet(path)['Close'].rename(ticker)
+        except Exception:
+            missing.append(ticker)  # Not cached yet (or an unreadable partial file)
+    
+    if missing:
+        fresh = download_closes(missing, period)
+        
+        # First download of the day clears out older files, so the cache never outgrows one day of history
+        os.makedirs(PRICE_CACHE_DIR, exist_ok=True)
+        prune_price_cache(as_of)
+        for ticker in fresh.columns:
+            closes = fresh[ticker].dropna()
+            if closes.empty:
+                continue  # Nothing came back; don't cache the miss
+            cached[ticker] = closes
+            
+            # Write to a temp file and rename, so concurrent sessions never read a half-written file
+            path = _price_cache_path(ticker, period, as_of)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            closes.rename('Close').to_frame().to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+    
+    if not cached:
+        return pd.DataFrame()
+    return pd.concat([cached[t] for t in tickers if t in cached], axis=1).sort_index()
+
+def trailing_window(closes, period):
+    """Rows of a close-price frame covering the trailing period, measured back from the last close"""
+    if closes.empty:
+        return closes
+    return closes[closes.index >= closes.index[-1] - PERIOD_OFFSETS[period]]
+
+def percent_changes(closes):
+    """Percent change between each ticker's first and last close (NaN where there isn't enough data)"""
+    if closes.empty:
+        return pd.Series(dtype=float)
+    
+    # Batched frames share one date index, so take each ticker's first/last traded close
+    first_close = closes.bfill().iloc[0]
+    last_close = closes.ffill().iloc[-1]
+    
+    pct = (last_close / first_close - 1) * 100
+    return pct.where(closes.count() >= 2)
+
+@st.cache_data(ttl=86400, show_spinner=False)  # Cache for 1 day
+def load_listed_symbols():
+    """Every symbol listed on a US exchange, from NASDAQ Trader's symbol directory
+    
+    Class shares are included in Yahoo's dash form (BRK-B) as well as the listed form.
+    Errors propagate so a failed download isn't cached.
+    """
+    client = get_yahoo_client()
+    symbols = set()
+    
+    for url, symbol_column in LISTED_SYMBOL_FILES.items():
+        response = client.get(url)
+        response.raise_for_status()
+        
+        listed = pd.read_csv(io.StringIO(response.text), sep='|', dtype=str)
+        listed = listed[listed['Test Issue'] == 'N']
+        
+        listed_symbols = listed[symbol_column].dropna()
+        symbols.update(listed_symbols)
+        symbols.update(listed_symbols.str.replace('.', '-', regex=False))
+    
+    return frozenset(symbols)
 
 def calculate_tickers_change(tickers, percent_change_threshold, time_period):
     if not tickers:
         st.warning("No tickers to analyze")
-        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
     
-    winners = []
-    all_results = []
-    filtered_winners = []  # Winners that pass the momentum filter
+    # Skip symbols that aren't listed on a US exchange (OTC, units, parse noise) before any yfinance call
+    try:
+        listed_symbols = load_listed_symbols()
+        unlisted = [ticker for ticker in tickers if ticker not in listed_symbols]
+        if unlisted:
+            tickers = [ticker for ticker in tickers if ticker in listed_symbols]
+            st.caption(f"Skipping {len(unlisted)} symbols not listed on a US exchange: {', '.join(unlisted[:20])}" + ('...' if len(unlisted) > 20 else ''))
+    except Exception as e:
+        st.warning(f"Could not load the US symbol list, analyzing every ticker: {str(e)}")
+    
+    if not tickers:
+        st.warning("No listed tickers to analyze")
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
     
     progress_bar = st.progress(0)
     status_text = st.empty()
     
     total = len(tickers)
     st.info(f"Analyzing {total} tickers ({time_period} price change)...")
-
-    for idx, ticker in enumerate(tickers):
+    
+    # Dynamic column name based on time period
+    period_label = time_period.upper() + ' Performance %'
+    
+    # Download 5 years of history once, in a few large batches, and slice every period from it:
+    # the selected period, plus 1Y/5Y for the momentum check, all come from the same cached data,
+    # so switching the period dropdown doesn't hit the network. Progress updates once per batch.
+    partial_results = st.empty()
+    chunks = [tickers[i:i + DOWNLOAD_CHUNK_SIZE] for i in range(0, total, DOWNLOAD_CHUNK_SIZE)]
+    chunk_closes = []
+    chunk_changes = []
+    for chunk_idx, chunk in enumerate(chunks):
+        status_text.text(f"Downloading price history ({min((chunk_idx + 1) * DOWNLOAD_CHUNK_SIZE, total)}/{total} tickers)...")
         try:
-            status_text.text(f"Processing {ticker} ({idx+1}/{total})")
-            
-            # Download historical data for the specified period
-            hist = yf.download(ticker, period=time_period, progress=False, auto_adjust=True)
-            
-            if not hist.empty and len(hist) >= 2:
-                # Handle multi-level columns if present
-                if isinstance(hist.columns, pd.MultiIndex):
-                    hist.columns = hist.columns.get_level_values(0)
-                
-                # Get first and last closing prices for selected period
-                first_close = float(hist['Close'].iloc[0])
-                last_close = float(hist['Close'].iloc[-1])
-                
-                # Calculate percentage change for selected period
-                percent_change = ((last_close - first_close) / first_close) * 100
-                
-                # Add to all results (simplified, just the main period data)
-                all_results.append([ticker, round(percent_change, 2)])
-                
-                # Get 1-year and 5-year data for momentum check (only for potential winners)
-                one_year_change = None
-                five_year_change = None
-                passes_momentum_filter = False
-                
-                if percent_change > percent_change_threshold:
-                    try:
-                        # Get 1-year data
-                        hist_1y = yf.download(ticker, period='1y', progress=False, auto_adjust=True)
-                        if not hist_1y.empty and len(hist_1y) >= 2:
-                            if isinstance(hist_1y.columns, pd.MultiIndex):
-                                hist_1y.columns = hist_1y.columns.get_level_values(0)
-                            one_year_change = ((float(hist_1y['Close'].iloc[-1]) - float(hist_1y['Close'].iloc[0])) / float(hist_1y['Close'].iloc[0])) * 100
-                        
-                        # Get 5-year data
-                        hist_5y = yf.download(ticker, period='5y', progress=False, auto_adjust=True)
-                        if not hist_5y.empty and len(hist_5y) >= 2:
-                            if isinstance(hist_5y.columns, pd.MultiIndex):
-                                hist_5y.columns = hist_5y.columns.get_level_values(0)
-                            five_year_change = ((float(hist_5y['Close'].iloc[-1]) - float(hist_5y['Close'].iloc[0])) / float(hist_5y['Close'].iloc[0])) * 100
-                        
-                        # Apply momentum filter: 5-year change should be greater than 1-year change
-                        if one_year_change is not None and five_year_change is not None:
-                            passes_momentum_filter = five_year_change > one_year_change
-                        
-                    except Exception as momentum_error:
-                        st.warning(f"Could not get momentum data for {ticker}: {str(momentum_error)}")
-                    
-                    # Create winner row with momentum data
-                    winner_row = [ticker, round(percent_change, 2)]
-                    if one_year_change is not None:
-                        winner_row.append(round(one_year_change, 2))
-                    else:
-                        winner_row.append(None)
-                    if five_year_change is not None:
-                        winner_row.append(round(five_year_change, 2))
-                    else:
-                        winner_row.append(None)
-                    winner_row.append(passes_momentum_filter)
-                    
-                    winners.append(winner_row)
-                    
-                    # Add to filtered winners if it passes momentum filter
-                    if passes_momentum_filter:
-                        filtered_winners.append(winner_row)
-            else:
-                st.warning(f"Insufficient data for {ticker}")
-                # Still add to all_results with None value
-                all_results.append([ticker, None])
-                
+            closes = get_closes(chunk, HISTORY_PERIOD)
+            chunk_closes.append(closes)
+            # Calculate percentage change for selected period, one value per ticker
+            chunk_changes.append(percent_changes(trailing_window(closes, time_period)))
         except Exception as e:
-            if len(ticker) <= 5:
-                st.warning(f"Error processing {ticker}: {str(e)}")
-            # Add to all_results with None value for failed tickers
-            all_results.append([ticker, None])
-            continue
+            st.error(f"Error downloading price history: {str(e)}")
+        progress_bar.progress((chunk_idx + 1) / len(chunks))
         
-        progress_bar.progress((idx + 1) / total)
+        # Show the best performers so far while the remaining batches download
+        if chunk_changes and chunk_idx < len(chunks) - 1:
+            so_far = pd.concat(chunk_changes).dropna().sort_values(ascending=False).round(2)
+            partial_results.dataframe(so_far.rename(period_label).rename_axis('Ticker').reset_index(), use_container_width=True, height=250)
+    
+    partial_results.empty()
+    
+    pct = (pd.concat(chunk_changes) if chunk_changes else pd.Series(dtype=float)).reindex(tickers)
+    
+    missing = pct.index[pct.isna()].tolist()
+    if missing:
+        st.warning(f"Insufficient data for {len(missing)} tickers: {', '.join(missing[:20])}" + ('...' if len(missing) > 20 else ''))
+    
+    # Get 1-year and 5-year changes for the momentum check (only for potential winners)
+    potential_winners = pct[pct > percent_change_threshold]
+    one_year = pd.Series(dtype=float)
+    five_year = pd.Series(dtype=float)
+    winner_closes = pd.DataFrame()
     
+    if not potential_winners.empty:
+        winner_closes = pd.concat(chunk_closes, axis=1)[potential_winners.index]
+        one_year = percent_changes(trailing_window(winner_closes, '1y'))
+        five_year = percent_changes(trailing_window(winner_closes, '5y'))
+    
+    progress_bar.progress(1.0)
     progress_bar.empty()
     status_text.empty()
     
-    # Dynamic column name based on time period
-    period_label = time_period.upper() + ' Performance %'
+    # Build the winners table column-wise from the aligned Series
+    winners_list = potential_winners.index.tolist()
+    one_year = one_year.reindex(winners_list)
+    five_year = five_year.reindex(winners_list)
     
-    # Create DataFrames with momentum columns for winners
-    winner_columns = [
-        'Ticker', 
-        period_label, 
-        '1Y Change %', 
-        '5Y Change %', 
-        'Momentum Filter ✓'
-    ]
+    # Apply momentum filter: 5-year change should be greater than 1-year change
+    passes_momentum_filter = (five_year > one_year) & one_year.notna() & five_year.notna()
     
-    winners_df = pd.DataFrame(winners, columns=winner_columns) if winners else pd.DataFrame()
-    filtered_winners_df = pd.DataFrame(filtered_winners, columns=winner_columns) if filtered_winners else pd.DataFrame()
+    winners_df = pd.DataFrame({
+        'Ticker': winners_list,
+        period_label: potential_winners.round(2).values,
+        '1Y Change %': one_year.round(2).values,
+        '5Y Change %': five_year.round(2).values,
+        'Momentum Filter ✓': passes_momentum_filter.values
+    }) if winners_list else pd.DataFrame()
+    
+    filtered_winners_df = winners_df[winners_df['Momentum Filter ✓']].reset_index(drop=True) if not winners_df.empty else pd.DataFrame()
     
     # All results simplified (just ticker and main period performance)
-    all_df = pd.DataFrame(all_results, columns=['Ticker', period_label]) if all_results else pd.DataFrame()
+    all_df = pct.round(2).rename(period_label).rename_axis('Ticker').reset_index()
     
     # Sort by percent change (handle empty DataFrames)
     if not winners_df.empty:
@@ -236,13 +762,18 @@ def calculate_tickers_change(tickers, percent_change_threshold, time_period):
         # Only sort non-null values
         all_df = all_df.sort_values(period_label, ascending=False, na_position='last')
     
-    return winners_df, filtered_winners_df, all_df
+    # Winners' 5-year closes go back too, so the detail cards can chart them without another download
+    return winners_df, filtered_winners_df, all_df, winner_closes
+
+@st.cache_data(ttl=86400, show_spinner=False)  # Cache for 1 day
+def fetch_company_info(ticker):
+    """Fetch the raw yfinance info dict for a ticker (errors propagate so they aren't cached)"""
+    return yf.Ticker(ticker, session=get_yf_session()).info
 
 def get_company_info(ticker):
     """Get company business summary and other key info"""
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = fetch_company_info(ticker)
         
         return {
             'business_summary': info.get('businessSummary', 'Business summary not available'),
@@ -264,71 +795,58 @@ def get_company_info(ticker):
             'company_name': ticker
         }
 
-def create_ticker_card(ticker_data, company_info):
-    """Create a card display for a ticker with chart and company info"""
+def create_ticker_card(ticker_data, company_info, closes):
+    """Create a card display for a ticker with chart and company info
+    
+    closes is the ticker's already-downloaded 5-year close series, so the chart needs no network call
+    """
     ticker = ticker_data[0]
     performance = ticker_data[1]
     one_year = ticker_data[2]
     five_year = ticker_data[3]
     
-    with st.container():
-        st.markdown(f"""
-        <div style="
-            border: 2px solid #1f77b4;
-            border-radius: 10px;
-            padding: 20px;
-            margin: 10px 0;
-            background-color: #f8f9fa;
-        ">
-        """, unsafe_allow_html=True)
-        
-        # Header with ticker and company name
-        col1, col2 = st.columns([1, 3])
-        with col1:
-            st.markdown(f"### 📈 {ticker}")
-            st.markdown(f"**5Y:** +{five_year:.1f}%")
-            st.markdown(f"**1Y:** +{one_year:.1f}%")
-        
-        with col2:
-            st.markdown(f"#### {company_info['company_name']}")
-            st.markdown(f"**Sector:** {company_info['sector']}")
-            st.markdown(f"**Industry:** {company_info['industry']}")
-        
-        # Get and display 5-year chart
-        try:
-            hist_5y = yf.download(ticker, period='5y', progress=False, auto_adjust=True)
-            if not hist_5y.empty:
-                # Handle multi-level columns
-                if isinstance(hist_5y.columns, pd.MultiIndex):
-                    hist_5y.columns = hist_5y.columns.get_level_values(0)
-                
-                st.markdown("**5-Year Price Chart:**")
-                st.line_chart(hist_5y['Close'])
-            else:
-                st.warning("Chart data not available")
-        except Exception as e:
-            st.warning(f"Could not load chart: {str(e)}")
-        
-        # Business summary
-        st.markdown("**Business Summary:**")
-        summary = company_info['business_summary']
-        if len(summary) > 500:
-            summary = summary[:500] + "..."
-        st.write(summary)
-        
-        # Additional info in columns
-        info_col1, info_col2, info_col3 = st.columns(3)
-        with info_col1:
-            if company_info['market_cap'] != 'N/A':
-                st.metric("Market Cap", f"${company_info['market_cap']:,}" if isinstance(company_info['market_cap'], int) else str(company_info['market_cap']))
-        with info_col2:
-            if company_info['employees'] != 'N/A':
-                st.metric("Employees", f"{company_info['employees']:,}" if isinstance(company_info['employees'], int) else str(company_info['employees']))
-        with info_col3:
-            if company_info['website'] != 'N/A':
-                st.markdown(f"[Company Website]({company_info['website']})")
-        
-        st.markdown("</div>", unsafe_allow_html=True)
+    # Business summary
+    summary = company_info['business_summary']
+    if len(summary) > 500:
+        summary = summary[:500] + "..."
+    summary = ' '.join(summary.split())  # A blank line would end the HTML block in markdown
+    
+    # Additional info shown along the bottom of the card
+    metrics = []
+    if company_info['market_cap'] != 'N/A':
+        market_cap = f"${company_info['market_cap']:,}" if isinstance(company_info['market_cap'], int) else str(company_info['market_cap'])
+        metrics.append(f'<div><small>Market Cap</small><br><b>{escape(market_cap)}</b></div>')
+    if company_info['employees'] != 'N/A':
+        employees = f"{company_info['employees']:,}" if isinstance(company_info['employees'], int) else str(company_info['employees'])
+        metrics.append(f'<div><small>Employees</small><br><b>{escape(employees)}</b></div>')
+    if company_info['website'] != 'N/A':
+        metrics.append(f'<div><a href="{escape(str(company_info["website"]))}" target="_blank">Company Website</a></div>')
+    
+    # Render the whole card as one HTML block so it costs a single frontend update
+    st.markdown(f"""
+<div style="border: 2px solid #1f77b4; border-radius: 10px; padding: 20px; margin: 10px 0; background-color: #f8f9fa;">
+<div style="display: flex; gap: 30px;">
+<div style="flex: 1;">
+<h3>📈 {escape(ticker)}</h3>
+<b>5Y:</b> +{five_year:.1f}%<br>
+<b>1Y:</b> +{one_year:.1f}%
+</div>
+<div style="flex: 3;">
+<h4>{escape(str(company_info['company_name']))}</h4>
+<b>Sector:</b> {escape(str(company_info['sector']))}<br>
+<b>Industry:</b> {escape(str(company_info['industry']))}
+</div>
+</div>
+<p><b>Business Summary:</b><br>{escape(summary)}</p>
+<div style="display: flex; gap: 40px;">{''.join(metrics)}</div>
+</div>
+""", unsafe_allow_html=True)
+    
+    # Display 5-year chart
+    if closes is not None and not closes.dropna().empty:
+        st.line_chart(closes.dropna().rename('Close'))
+    else:
+        st.warning("Chart data not available")
 
 # Streamlit UI
 st.title('Earnings Calendar Price Change Analyzer')
@@ -360,30 +878,22 @@ elif filter_mode == "Date Range":
     
     if start_date <= end_date:
         # Check for weekend/holiday warnings
-        current_date = start_date
-        business_days = 0
-        weekend_days = 0
-        
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # Monday = 0, Friday = 4
-                business_days += 1
-            else:
-                weekend_days += 1
-            current_date += timedelta(days=1)
-        
         total_days = (end_date - start_date).days + 1
+        business_days = int(np.busday_count(start_date, end_date + timedelta(days=1)))
+        weekend_days = total_days - business_days
         
-        # Generate all dates in the range
+        # Generate the business days in the range (weekends have no earnings to fetch)
         current_date = start_date
         while current_date <= end_date:
-            selected_dates.append(current_date.strftime('%Y-%m-%d'))
+            if current_date.weekday() < 5:
+                selected_dates.append(current_date.strftime('%Y-%m-%d'))
             current_date += timedelta(days=1)
         
         st.info(f"📅 **Date range:** {start_date.strftime('%B %d, %Y')} to {end_date.strftime('%B %d, %Y')}")
         st.info(f"📊 **Total:** {total_days} days • **Business days:** {business_days} • **Weekends:** {weekend_days}")
         
         if weekend_days > 0:
-            st.warning(f"⚠️ Note: {weekend_days} weekend days included. Earnings calendars typically have limited activity on weekends.")
+            st.warning(f"⚠️ Note: {weekend_days} weekend days skipped. Earnings calendars typically have limited activity on weekends.")
     else:
         st.error("❌ Start date must be before or equal to end date!")
 
@@ -401,7 +911,8 @@ elif filter_mode == "Multiple Specific Dates":
     with col2:
         if st.button("➕ Add Date", key="add_date"):
             date_str = new_date.strftime('%Y-%m-%d')
-            if date_str not in st.session_state.earnings_dates and len(st.session_state.earnings_dates) < 10:
+            existing_dates = set(st.session_state.earnings_dates)
+            if date_str not in existing_dates and len(st.session_state.earnings_dates) < 10:
                 st.session_state.earnings_dates.append(date_str)
                 st.rerun()
     
@@ -414,7 +925,7 @@ elif filter_mode == "Multiple Specific Dates":
                 st.write(f"{i+1}. {datetime.strptime(date_str, '%Y-%m-%d').strftime('%B %d, %Y')}")
             with col2:
                 if st.button("🗑️", key=f"remove_{i}", help="Remove this date"):
-                    st.session_state.earnings_dates.pop(i)
+                    st.session_state.earnings_dates = [d for j, d in enumerate(st.session_state.earnings_dates) if j != i]
                     st.rerun()
         
         # Clear all button
@@ -454,32 +965,18 @@ if st.button('🚀 Analyze Tickers'):
     else:
         # Combine all tickers from selected dates
         all_tickers = set()
-        date_results = {}  # Track results per date
         
-        # Create progress tracking
-        total_dates = len(selected_dates)
-        date_progress = st.progress(0)
-        date_status = st.empty()
+        with st.spinner(f'Fetching tickers from {len(selected_dates)} selected date(s)...'):
+            date_results = fetch_earnings_tickers_for_dates(selected_dates)
         
-        with st.spinner('Fetching tickers from selected dates...'):
-            for i, date in enumerate(selected_dates):
-                date_status.text(f"Processing date {i+1}/{total_dates}: {datetime.strptime(date, '%Y-%m-%d').strftime('%B %d, %Y')}")
-                
-                tickers_for_date = fetch_earnings_tickers(date)
-                date_results[date] = tickers_for_date
-                
-                if tickers_for_date:
-                    all_tickers.update(tickers_for_date)
-                    st.success(f"✅ {date}: Found {len(tickers_for_date)} tickers")
-                else:
-                    st.warning(f"⚠️ {date}: No tickers found")
-                
-                # Update progress
-                date_progress.progress((i + 1) / total_dates)
-        
-        # Clear progress indicators
-        date_progress.empty()
-        date_status.empty()
+        for date in selected_dates:
+            tickers_for_date = date_results[date]
+            
+            if tickers_for_date:
+                all_tickers.update(tickers_for_date)
+                st.success(f"✅ {date}: Found {len(tickers_for_date)} tickers")
+            else:
+                st.warning(f"⚠️ {date}: No tickers found")
         
         # Convert to sorted list
         final_tickers = sorted(list(all_tickers))
@@ -518,7 +1015,7 @@ if st.button('🚀 Analyze Tickers'):
                 st.write("**All tickers:**", ", ".join(final_tickers))
             
             # Run the analysis
-            winners, filtered_winners, all_results = calculate_tickers_change(final_tickers, percent_change_threshold, time_period)
+            winners, filtered_winners, all_results, winner_closes = calculate_tickers_change(final_tickers, percent_change_threshold, time_period)
             
             st.success(f"✅ Analysis completed!")
             
@@ -594,11 +1091,14 @@ if st.button('🚀 Analyze Tickers'):
                 if len(filtered_winners) > 10:
                     st.info(f"Showing top 10 out of {len(filtered_winners)} filtered winners")
                 
+                # Fetch company details for all cards at once instead of one round-trip per card
+                with st.spinner("Loading company details..."):
+                    with ThreadPoolExecutor(max_workers=MAX_INFO_WORKERS) as executor:
+                        infos = dict(zip(top_filtered['Ticker'], executor.map(get_company_info, top_filtered['Ticker'])))
+                
                 # Create cards for each filtered winner
                 for idx, row in top_filtered.iterrows():
-                    with st.spinner(f"Loading details for {row['Ticker']}..."):
-                        company_info = get_company_info(row['Ticker'])
-                        create_ticker_card(row.values, company_info)
+                    create_ticker_card(row.values, infos[row['Ticker']], winner_closes.get(row['Ticker']))
             else:
                 st.info("No filtered winners to display detailed cards for.")
 
@@ -1,10 +1,17 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-import json
+import threading
+import gzip
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
 from datetime import datetime
-from datetime import datetime, timedelta
 import re
 import io
 import os
@@ -39,34 +46,63 @@ SEC_HEADERS = {
     'Connection': 'keep-alive'
 }
 
-# Rate limiting for SEC API (10 requests per second max)
-last_request_time = 0
+# Rate limiting for SEC API (10 requests per second max), as a token bucket shared by all threads.
+# The bucket holds a single token, so no burst ever exceeds the limit: requests stay >= 100ms apart.
+SEC_REQUESTS_PER_SECOND = 10
+SEC_BUCKET_SIZE = 1
+sec_tokens = SEC_BUCKET_SIZE
+sec_last_refill = time.monotonic()
+rate_limit_lock = threading.Lock()
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+# Tickers analyzed at once in batch mode; rate_limit still caps the actual request rate
+MAX_SEC_WORKERS = 8
+
+# SEC JSON kept on disk (gzipped) between runs. Submissions are refreshed daily so new filings show up;
+# facts are kept longer but refetched as soon as the submissions list a filing newer than the cached copy
+SEC_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.investor_cache', 'sec')
+SEC_SUBMISSIONS_TTL_DAYS = 1
+SEC_FACTS_TTL_DAYS = 90
+
+@st.cache_resource
+def get_sec_session():
+    """Shared keep-alive session for SEC requests, so every lookup and rerun reuses warm connections"""
+    session = requests.Session()
+    session.headers.update(SEC_HEADERS)
+    # Retry throttled/unavailable responses with backoff (honours Retry-After); other statuses are handled by the callers
+    retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+@st.cache_resource(ttl=86400)  # Cache for 1 day
 def load_company_tickers():
-    """Load company ticker to CIK mapping from SEC"""
+    """Load company ticker to CIK mapping from SEC
+    
+    Shared read-only across sessions (cache_resource), so lookups don't unpickle a fresh copy of the table each time.
+    """
     try:
         st.info("🔄 Loading SEC company database...")
         rate_limit()
         
         # Use the correct SEC endpoint with proper headers
         url = "https://www.sec.gov/files/company_tickers.json"
-        response = requests.get(url, headers=SEC_HEADERS, timeout=30)
+        response = get_sec_session().get(url, timeout=30)
         
         if response.status_code == 200:
-            tickers_data = response.json()
+            tickers_data = orjson.loads(response.content)
             
-            # Convert to DataFrame for easier lookup
-            ticker_list = []
-            for key, company in tickers_data.items():
-                ticker_list.append({
-                    'ticker': str(company['ticker']).upper(),
-                    'cik': str(company['cik_str']).zfill(10),  # Pad CIK to 10 digits
-                    'title': company['title']
+            # Convert to DataFrame for easier lookup, normalizing whole columns at once
+            if tickers_data:
+                companies = pd.DataFrame.from_dict(tickers_data, orient='index')
+                df = pd.DataFrame({
+                    'ticker': companies['ticker'].astype(str).str.upper(),
+                    'cik': companies['cik_str'].astype(str).str.zfill(10),  # Pad CIK to 10 digits
+                    'title': companies['title']
                 })
                 
-            if ticker_list:
-                df = pd.DataFrame(ticker_list)
+                # Index by ticker (first listing wins) so CIK lookups are hash lookups instead of full-column scans
+                df = df.drop_duplicates('ticker')
+                df.index = df['ticker'].values
                 st.success(f"✅ Loaded {len(df):,} companies from SEC database")
                 return df
         
@@ -111,45 +147,108 @@ def load_company_tickers():
     return pd.DataFrame()
 
 def rate_limit():
-    """Enforce SEC API rate limiting"""
-    global last_request_time
-    current_time = time.time()
-    time_since_last = current_time - last_request_time
-    if time_since_last < 0.1:  # 100ms between requests
-        time.sleep(0.1 - time_since_last)
-    last_request_time = time.time()
+    """Enforce SEC API rate limiting (blocks until a request token is available)"""
+    global sec_tokens, sec_last_refill
+    while True:
+        with rate_limit_lock:
+            # Refill for the time elapsed, capped at the bucket size
+            now = time.monotonic()
+            sec_tokens = min(SEC_BUCKET_SIZE, sec_tokens + (now - sec_last_refill) * SEC_REQUESTS_PER_SECOND)
+            sec_last_refill = now
+            if sec_tokens >= 1:
+                sec_tokens -= 1
+                return
+            wait = (1 - sec_tokens) / SEC_REQUESTS_PER_SECOND
+        # Sleep outside the lock so other waiters aren't serialized behind this one
+        time.sleep(wait)
 
 def get_company_cik(ticker, ticker_df):
     """Get company CIK from ticker symbol"""
     if ticker_df.empty:
         return None
     
-    # Look up ticker in the DataFrame
-    match = ticker_df[ticker_df['ticker'].str.upper() == ticker.upper()]
-    if not match.empty:
-        return int(match.iloc[0]['cik'])
+    # Look up ticker in the DataFrame's ticker index
+    cik = ticker_df['cik'].get(ticker.upper())
+    if cik is not None:
+        return int(cik)
     
     return None
 
+@st.cache_resource(ttl=86400, show_spinner=False)
+def prune_sec_cache():
+    """Delete cached SEC documents older than the longest TTL (runs at most once a day per process)"""
+    cutoff = time.time() - max(SEC_SUBMISSIONS_TTL_DAYS, SEC_FACTS_TTL_DAYS) * 86400
+    try:
+        names = os.listdir(SEC_CACHE_DIR)
+    except FileNotFoundError:
+        return
+    for name in names:
+        path = os.path.join(SEC_CACHE_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass  # Another session may have removed it already
+
+def fetch_sec_json(url, ttl_days, latest_filing_date=None):
+    """Fetch a JSON document from the SEC API, reusing a gzipped copy on disk for up to ttl_days
+    
+    A copy saved on or before latest_filing_date (YYYY-MM-DD) is stale regardless of age.
+    Errors propagate, so failures are never cached.
+    """
+    path = os.path.join(SEC_CACHE_DIR, hashlib.md5(url.encode()).hexdigest() + '.json.gz')
+    
+    # Serve the cached copy while it's fresh, without spending rate-limit tokens
+    try:
+        saved_at = os.path.getmtime(path)
+        saved_after_filing = not latest_filing_date or datetime.fromtimestamp(saved_at).strftime('%Y-%m-%d') > latest_filing_date
+        if time.time() - saved_at < ttl_days * 86400 and saved_after_filing:
+            with gzip.open(path, 'rb') as f:
+                return orjson.loads(f.read())
+    except (OSError, EOFError, orjson.JSONDecodeError):
+        pass  # Missing, expired or unreadable: fetch it again
+    
+    rate_limit()
+    response = get_sec_session().get(url, timeout=30)
+    response.raise_for_status()
+    # Company facts run to several MB for large filers; orjson parses them much faster than the stdlib
+    data = orjson.loads(response.content)
+    
+    # Write to a temp file and rename, so concurrent sessions never read a half-written file;
+    # refetching a URL overwrites its old copy, and pruning drops documents nobody asks for anymore
+    os.makedirs(SEC_CACHE_DIR, exist_ok=True)
+    prune_sec_cache()
+    # mkstemp names are unique across processes (financials and quarterly_insights can fetch the same URL)
+    fd, tmp_path = tempfile.mkstemp(dir=SEC_CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+            f.write(response.content)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Caching is best-effort; the fetched data is still good
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    
+    return data
+
 def get_company_submissions(cik):
     """Get company submissions from SEC API"""
     if not cik:
         return None
     
-    rate_limit()
     url = f"{SEC_BASE_URL}/submissions/CIK{cik:010d}.json"
     
     try:
-        response = requests.get(url, headers=SEC_HEADERS, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return fetch_sec_json(url, SEC_SUBMISSIONS_TTL_DAYS)
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 403:
             st.warning(f"SEC API access denied for CIK {cik}. Possible rate limiting.")
         else:
             st.error(f"HTTP Error fetching submissions for CIK {cik}: {e}")
         return None
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         st.error(f"Network error fetching submissions for CIK {cik}: {e}")
         return None
 
@@ -158,20 +257,22 @@ def get_company_facts(cik):
     if not cik:
         return None
     
-    rate_limit()
     url = f"{SEC_BASE_URL}/api/xbrl/companyfacts/CIK{cik:010d}.json"
     
+    # Facts only change when the company files, so the newest filing date decides whether the cached copy is current
+    submissions = get_company_submissions(cik)
+    filing_dates = submissions.get('filings', {}).get('recent', {}).get('filingDate', []) if submissions else []
+    latest_filing_date = max(filing_dates, default=None)
+    
     try:
-        response = requests.get(url, headers=SEC_HEADERS, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return fetch_sec_json(url, SEC_FACTS_TTL_DAYS, latest_filing_date)
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 403:
             st.warning(f"SEC API access denied for company facts CIK {cik}. Possible rate limiting.")
         else:
             st.error(f"HTTP Error fetching company facts for CIK {cik}: {e}")
         return None
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         st.error(f"Network error fetching company facts for CIK {cik}: {e}")
         return None
 
@@ -247,7 +348,6 @@ Debt Concerns: {'Yes' if analysis_result.get('debt_concerns') else 'No'}"""
         revenue_date = metrics.get('Revenues', {}).get('date', '') if 'Revenues' in metrics else ''
         
         # Check for date mismatches (only flag if >6 months difference)
-        from datetime import datetime, timedelta
         if cash_date and debt_date:
             try:
                 cash_dt = datetime.strptime(cash_date, '%Y-%m-%d')
@@ -315,7 +415,6 @@ Be honest but fair - profitable companies with manageable debt are suitable for
         ai_response = response.choices[0].message.content.strip()
         
         # Remove any LaTeX or mathematical formatting artifacts
-        import re
         # Remove LaTeX math mode markers
         ai_response = re.sub(r'\$\$?', '', ai_response)
         # Remove backslashes used in LaTeX
@@ -343,13 +442,91 @@ Be honest but fair - profitable companies with manageable debt are suitable for
     filings.sort(key=lambda x: x['filingDate'], reverse=True)
     return filings[:5]  # Return top 5 most recent
 
-def extract_quarterly_trends(facts_data):
+# Concepts checked for each quarterly trend line, in priority order
+TREND_CONCEPTS = {
+    'revenues': ['Revenues', 'RevenueFromContractWithCustomerExcludingAssessedTax', 'SalesRevenueNet', 'RevenueFromContractWithCustomerIncludingAssessedTax'],
+    'costs': ['CostOfRevenue', 'CostOfGoodsAndServicesSold', 'OperatingExpenses'],
+    'net_income': ['NetIncomeLoss', 'NetIncomeLossAvailableToCommonStockholdersBasic']
+}
+
+# Common financial concepts to look for with improved concept mapping
+KEY_FINANCIAL_CONCEPTS = {
+    'Revenues': ['Revenues', 'RevenueFromContractWithCustomerExcludingAssessedTax', 'SalesRevenueNet', 'RevenueFromContractWithCustomerIncludingAssessedTax'],
+    'NetIncome': ['NetIncomeLoss', 'ProfitLoss', 'NetIncomeLossAvailableToCommonStockholdersBasic', 'NetIncomeLossAttributableToParent'],
+    'TotalAssets': ['Assets', 'AssetsCurrent', 'AssetsNoncurrent'],
+    'TotalLiabilities': ['Liabilities', 'LiabilitiesAndStockholdersEquity', 'LiabilitiesCurrent'],
+    'Cash': ['CashAndCashEquivalentsAtCarryingValue', 'Cash', 'CashCashEquivalentsAndShortTermInvestments', 'CashAndCashEquivalentsFairValueDisclosure'],
+    'Debt': ['LongTermDebt', 'LongTermDebtCurrent', 'LongTermDebtNoncurrent', 'LongTermDebtAndCapitalLeaseObligations', 'LongTermDebtAndCapitalLeaseObligationsCurrent', 'DebtCurrent', 'ShortTermBorrowings'],
+    'TotalDebt': [
+        'DebtAndCapitalLeaseObligations', 
+        'DebtLongtermAndShorttermCombinedAmount', 
+        'LongTermDebt',
+        'LongTermDebtAndCapitalLeaseObligations',
+        'LongTermDebtAndCapitalLeaseObligationsCurrent',
+        'ConvertibleDebt',
+        'ConvertibleNotesPayable',
+        'ConvertibleDebtNoncurrent',
+        'DebtInstrumentCarryingAmount',
+        'SeniorNotes'
+    ]  # Comprehensive debt concepts including current portions
+}
+
+# Every concept either extractor reads, so company facts are bucketed once for both
+USD_FACT_CONCEPTS = frozenset(
+    concept
+    for concept_map in (TREND_CONCEPTS, KEY_FINANCIAL_CONCEPTS)
+    for concept_list in concept_map.values()
+    for concept in concept_list
+)
+
+def usd_fact_buckets(values):
+    """Split a concept's USD facts into valid, annual and quarterly lists, each sorted most recent first"""
+    facts = pd.DataFrame(values)
+    if facts.empty or not {'end', 'val'}.issubset(facts.columns):
+        return {'valid': [], 'annual': [], 'quarterly': []}
+    
+    # Valid facts have a value and an end date
+    facts = facts[facts['val'].notna() & (facts['end'].fillna('') != '')]
+    facts = facts.sort_values('end', ascending=False, kind='stable')
+    
+    # Parse every start/end date in one pass; missing or malformed dates become NaT and fit no bucket
+    if 'start' in facts.columns:
+        start = pd.to_datetime(facts['start'], format='%Y-%m-%d', errors='coerce')
+        end = pd.to_datetime(facts['end'], format='%Y-%m-%d', errors='coerce')
+        period_days = (end - start).dt.days
+    else:
+        period_days = pd.Series(float('nan'), index=facts.index)
+    
+    # Categorize STRICTLY by period length (ignore form type to avoid 9-month confusion):
+    # annual = 300+ days, quarterly = 60-120 days only (excludes 9-month cumulative at ~270 days)
+    return {
+        'valid': [values[i] for i in facts.index],
+        'annual': [values[i] for i in facts.index[(period_days >= 300).values]],
+        'quarterly': [values[i] for i in facts.index[period_days.between(60, 120).values]]
+    }
+
+def bucket_usd_facts(facts_data):
+    """Bucket the USD facts of every concept the extractors use, in a single pass over the company facts
+    
+    extract_key_financials and extract_quarterly_trends both accept the result, so the work isn't repeated.
+    """
+    us_gaap = facts_data['facts'].get('us-gaap', {})
+    
+    buckets = {}
+    for concept in USD_FACT_CONCEPTS:
+        if concept in us_gaap:
+            units = us_gaap[concept].get('units', {})
+            if 'USD' in units:
+                buckets[concept] = usd_fact_buckets(units['USD'])
+    return buckets
+
+def extract_quarterly_trends(facts_data, buckets=None):
     """Extract quarterly financial trends for revenue, costs, and profit"""
     if not facts_data or 'facts' not in facts_data:
         return None
     
-    facts = facts_data['facts']
-    us_gaap = facts.get('us-gaap', {})
+    if buckets is None:
+        buckets = bucket_usd_facts(facts_data)
     
     trends = {
         'periods': [],
@@ -358,52 +535,26 @@ def extract_quarterly_trends(facts_data):
         'net_income': []
     }
     
-    # Revenue concepts
-    revenue_concepts = ['Revenues', 'RevenueFromContractWithCustomerExcludingAssessedTax', 'SalesRevenueNet', 'RevenueFromContractWithCustomerIncludingAssessedTax']
-    # Cost concepts
-    cost_concepts = ['CostOfRevenue', 'CostOfGoodsAndServicesSold', 'OperatingExpenses']
-    # Net income concepts
-    income_concepts = ['NetIncomeLoss', 'NetIncomeLossAvailableToCommonStockholdersBasic']
-    
     # Extract quarterly data for each metric - check ALL concepts and pick most recent
-    for concept_list, data_key in [(revenue_concepts, 'revenues'), 
-                                     (cost_concepts, 'costs'), 
-                                     (income_concepts, 'net_income')]:
+    for data_key, concept_list in TREND_CONCEPTS.items():
         best_quarterly_values = []
         best_date = ''
         
         for concept in concept_list:
-            if concept in us_gaap:
-                units = us_gaap[concept].get('units', {})
-                if 'USD' in units:
-                    values = units['USD']
-                    # Filter for quarterly data (STRICTLY 60-120 days only)
-                    quarterly_values = []
-                    for v in values:
-                        if v.get('val') is not None and v.get('end') and v.get('start'):
-                            try:
-                                start = datetime.strptime(v.get('start'), '%Y-%m-%d')
-                                end = datetime.strptime(v.get('end'), '%Y-%m-%d')
-                                period_days = (end - start).days
-                                # Quarterly period STRICTLY 60-120 days (excludes 9-month cumulative at ~270 days)
-                                if 60 <= period_days <= 120:
-                                    quarterly_values.append(v)
-                            except:
-                                pass
-                    
-                    # Sort by end date (most recent first)
-                    quarterly_values.sort(key=lambda x: x.get('end', ''), reverse=True)
-                    
-                    # Check if this concept has more recent data than what we've found so far
-                    if quarterly_values and len(quarterly_values) >= 6:
-                        most_recent_date = quarterly_values[0].get('end', '')
-                        if most_recent_date > best_date:
-                            best_date = most_recent_date
-                            best_quarterly_values = quarterly_values
+            if concept in buckets:
+                # Quarterly data (STRICTLY 60-120 days only), most recent first
+                quarterly_values = buckets[concept]['quarterly']
+                
+                # Check if this concept has more recent data than what we've found so far
+                if len(quarterly_values) >= 6:
+                    most_recent_date = quarterly_values[0].get('end', '')
+                    if most_recent_date > best_date:
+                        best_date = most_recent_date
+                        best_quarterly_values = quarterly_values
         
         # Use the best (most recent) quarterly values found across all concepts
         if best_quarterly_values:
-            if len(best_quarterly_values) >= 6 and not trends['periods']:
+            if not trends['periods']:
                 # Store periods (only once, from the first metric with data)
                 trends['periods'] = [v.get('end') for v in best_quarterly_values[:6]]
                 trends['periods'].reverse()  # Oldest to newest for chart
@@ -418,148 +569,91 @@ def extract_quarterly_trends(facts_data):
         return trends
     return None
 
-def extract_key_financials(facts_data):
+def extract_key_financials(facts_data, buckets=None):
     """Extract key financial metrics from company facts - prioritizing most recent data"""
     if not facts_data or 'facts' not in facts_data:
         return {}
     
-    facts = facts_data['facts']
-    key_metrics = {}
+    if buckets is None:
+        buckets = bucket_usd_facts(facts_data)
     
-    # Common financial concepts to look for with improved concept mapping
-    concepts_to_find = {
-        'Revenues': ['Revenues', 'RevenueFromContractWithCustomerExcludingAssessedTax', 'SalesRevenueNet', 'RevenueFromContractWithCustomerIncludingAssessedTax'],
-        'NetIncome': ['NetIncomeLoss', 'ProfitLoss', 'NetIncomeLossAvailableToCommonStockholdersBasic', 'NetIncomeLossAttributableToParent'],
-        'TotalAssets': ['Assets', 'AssetsCurrent', 'AssetsNoncurrent'],
-        'TotalLiabilities': ['Liabilities', 'LiabilitiesAndStockholdersEquity', 'LiabilitiesCurrent'],
-        'Cash': ['CashAndCashEquivalentsAtCarryingValue', 'Cash', 'CashCashEquivalentsAndShortTermInvestments', 'CashAndCashEquivalentsFairValueDisclosure'],
-        'Debt': ['LongTermDebt', 'LongTermDebtCurrent', 'LongTermDebtNoncurrent', 'LongTermDebtAndCapitalLeaseObligations', 'LongTermDebtAndCapitalLeaseObligationsCurrent', 'DebtCurrent', 'ShortTermBorrowings'],
-        'TotalDebt': [
-            'DebtAndCapitalLeaseObligations', 
-            'DebtLongtermAndShorttermCombinedAmount', 
-            'LongTermDebt',
-            'LongTermDebtAndCapitalLeaseObligations',
-            'LongTermDebtAndCapitalLeaseObligationsCurrent',
-            'ConvertibleDebt',
-            'ConvertibleNotesPayable',
-            'ConvertibleDebtNoncurrent',
-            'DebtInstrumentCarryingAmount',
-            'SeniorNotes'
-        ]  # Comprehensive debt concepts including current portions
-    }
-    
-    # Look in us-gaap taxonomy
-    us_gaap = facts.get('us-gaap', {})
+    key_metrics = {}
     
-    for metric_name, concept_list in concepts_to_find.items():
+    for metric_name, concept_list in KEY_FINANCIAL_CONCEPTS.items():
         best_metric = None
         best_date = ''
         
         # Check ALL concepts for this metric and find the one with most recent data
         for concept in concept_list:
-            if concept in us_gaap:
-                units = us_gaap[concept].get('units', {})
-                if 'USD' in units:
-                    values = units['USD']
-                    
-                    # Strategy: Get most recent data regardless of form type, but prefer more recent filings
-                    # Filter out invalid/null values and sort by end date
-                    valid_values = [v for v in values if v.get('val') is not None and v.get('end')]
-                    
-                    if valid_values:
-                        # Sort by end date (most recent first)
-                        valid_values.sort(key=lambda x: x.get('end', ''), reverse=True)
+            if concept in buckets:
+                # Strategy: Get most recent data regardless of form type, but prefer more recent filings
+                # Valid values are already filtered for null values and sorted by end date (most recent first)
+                valid_values = buckets[concept]['valid']
+                
+                if valid_values:
+                    # For point-in-time data (Cash, Debt, TotalDebt, Assets, Liabilities), use most recent
+                    if metric_name in ['Cash', 'Debt', 'TotalDebt', 'TotalAssets', 'TotalLiabilities']:
+                        # Get the most recent point-in-time value
+                        most_recent = valid_values[0]
+                        candidate_date = most_recent.get('end', '')
+                        
+                        # Only update if this concept has more recent data
+                        if candidate_date > best_date:
+                            best_date = candidate_date
+                            best_metric = {
+                                'value': most_recent.get('val'),
+                                'date': most_recent.get('end'),
+                                'form': most_recent.get('form'),
+                                'filed': most_recent.get('filed'),
+                                'period_type': 'Point-in-Time',
+                                'concept': concept
+                            }
+                    else:
+                        # For period data (Revenues, NetIncome), get most recent period regardless of type
+                        annual_values = buckets[concept]['annual']
+                        quarterly_values = buckets[concept]['quarterly']
+                        
+                        # PRIORITY: Use the most recent data by date, whether annual or quarterly
+                        # Compare dates if we have both types
+                        selected_value = None
+                        period_type = ''
+                        
+                        if annual_values and quarterly_values:
+                            # Compare dates - use whichever is more recent
+                            annual_date = annual_values[0].get('end', '')
+                            quarterly_date = quarterly_values[0].get('end', '')
+                            
+                            if quarterly_date > annual_date:
+                                selected_value = quarterly_values[0]
+                                period_type = 'Quarterly'
+                            else:
+                                selected_value = annual_values[0]
+                                period_type = 'Annual'
+                        elif annual_values:
+                            selected_value = annual_values[0]
+                            period_type = 'Annual'
+                        elif quarterly_values:
+                            selected_value = quarterly_values[0]
+                            period_type = 'Quarterly'
+                        elif valid_values:
+                            selected_value = valid_values[0]  # Fallback to most recent
+                            period_type = 'Unknown Period'
                         
-                        # For point-in-time data (Cash, Debt, TotalDebt, Assets, Liabilities), use most recent
-                        if metric_name in ['Cash', 'Debt', 'TotalDebt', 'TotalAssets', 'TotalLiabilities']:
-                            # Get the most recent point-in-time value
-                            most_recent = valid_values[0]
-                            candidate_date = most_recent.get('end', '')
+                        if selected_value:
+                            candidate_date = selected_value.get('end', '')
                             
                             # Only update if this concept has more recent data
                             if candidate_date > best_date:
                                 best_date = candidate_date
                                 best_metric = {
-                                    'value': most_recent.get('val'),
-                                    'date': most_recent.get('end'),
-                                    'form': most_recent.get('form'),
-                                    'filed': most_recent.get('filed'),
-                                    'period_type': 'Point-in-Time',
+                                    'value': selected_value.get('val'),
+                                    'date': selected_value.get('end'),
+                                    'form': selected_value.get('form'),
+                                    'filed': selected_value.get('filed'),
+                                    'period_type': period_type,
+                                    'start_date': selected_value.get('start'),
                                     'concept': concept
                                 }
-                        else:
-                            # For period data (Revenues, NetIncome), get most recent period regardless of type
-                            # Sort all valid values by end date to get the absolute most recent
-                            annual_values = []
-                            quarterly_values = []
-                            
-                            for v in valid_values:
-                                form = v.get('form', '')
-                                start_date = v.get('start', '')
-                                end_date = v.get('end', '')
-                                
-                                # Calculate period length if we have start and end dates
-                                period_days = 0
-                                if start_date and end_date:
-                                    try:
-                                        from datetime import datetime
-                                        start = datetime.strptime(start_date, '%Y-%m-%d')
-                                        end = datetime.strptime(end_date, '%Y-%m-%d')
-                                        period_days = (end - start).days
-                                    except:
-                                        pass
-                                
-                                # Categorize STRICTLY by period length (ignore form type to avoid 9-month confusion)
-                                if period_days >= 300:  # Annual = 300+ days
-                                    annual_values.append(v)
-                                elif 60 <= period_days <= 120:  # Quarterly = 60-120 days only (single quarter)
-                                    quarterly_values.append(v)
-                            
-                            # Sort both arrays by end date (most recent first)
-                            annual_values.sort(key=lambda x: x.get('end', ''), reverse=True)
-                            quarterly_values.sort(key=lambda x: x.get('end', ''), reverse=True)
-                            
-                            # PRIORITY: Use the most recent data by date, whether annual or quarterly
-                            # Compare dates if we have both types
-                            selected_value = None
-                            period_type = ''
-                            
-                            if annual_values and quarterly_values:
-                                # Compare dates - use whichever is more recent
-                                annual_date = annual_values[0].get('end', '')
-                                quarterly_date = quarterly_values[0].get('end', '')
-                                
-                                if quarterly_date > annual_date:
-                                    selected_value = quarterly_values[0]
-                                    period_type = 'Quarterly'
-                                else:
-                                    selected_value = annual_values[0]
-                                    period_type = 'Annual'
-                            elif annual_values:
-                                selected_value = annual_values[0]
-                                period_type = 'Annual'
-                            elif quarterly_values:
-                                selected_value = quarterly_values[0]
-                                period_type = 'Quarterly'
-                            elif valid_values:
-                                selected_value = valid_values[0]  # Fallback to most recent
-                                period_type = 'Unknown Period'
-                            
-                            if selected_value:
-                                candidate_date = selected_value.get('end', '')
-                                
-                                # Only update if this concept has more recent data
-                                if candidate_date > best_date:
-                                    best_date = candidate_date
-                                    best_metric = {
-                                        'value': selected_value.get('val'),
-                                        'date': selected_value.get('end'),
-                                        'form': selected_value.get('form'),
-                                        'filed': selected_value.get('filed'),
-                                        'period_type': period_type,
-                                        'start_date': selected_value.get('start'),
-                                        'concept': concept
-                                    }
         
         # After checking all concepts for this metric, save the best one found
         if best_metric:
@@ -927,11 +1021,14 @@ def process_ticker_analysis(ticker, ticker_df):
         # Find recent filings
         recent_filings = find_recent_filings(submissions_data)
         
+        # Bucket each concept's facts once and share them between both extractors
+        buckets = bucket_usd_facts(facts_data)
+        
         # Extract key financials
-        key_metrics = extract_key_financials(facts_data)
+        key_metrics = extract_key_financials(facts_data, buckets)
         
         # Extract quarterly trends
-        quarterly_trends = extract_quarterly_trends(facts_data)
+        quarterly_trends = extract_quarterly_trends(facts_data, buckets)
         
         # Analyze financial health
         analysis = analyze_financial_health(key_metrics)
@@ -971,6 +1068,8 @@ def main():
         ticker_df = load_company_tickers()
     
     if ticker_df.empty:
+        # Don't keep the failed load for the rest of the day; the next rerun tries again
+        load_company_tickers.clear()
         st.error("⚠️ Could not load SEC ticker database. The tool can still work with manual ticker entry.")
         
         # Show manual entry option when database fails to load
@@ -1024,7 +1123,7 @@ def main():
         analyze_single = st.button("🚀 Analyze Ticker", type="primary")
         
         if analyze_single and test_ticker:
-            if test_ticker.upper() in ticker_df['ticker'].values:
+            if test_ticker.upper() in ticker_df.index:
                 st.session_state['single_ticker_result'] = test_ticker.upper()
                 st.session_state['single_ticker_analyzed'] = True
             else:
@@ -1140,17 +1239,20 @@ def main():
                         status_text = st.empty()
                         results_container = st.container()
                         
-                        analysis_results = []
+                        results_by_ticker = {}
+                        
+                        # Analyze several tickers at once so their SEC round-trips overlap; worker threads
+                        # get the script context so warnings from the SEC helpers still reach the page
+                        with ThreadPoolExecutor(max_workers=MAX_SEC_WORKERS, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())) as executor:
+                            futures = {executor.submit(process_ticker_analysis, ticker, ticker_df): ticker for ticker in tickers_to_analyze}
+                            for i, future in enumerate(as_completed(futures)):
+                                ticker = futures[future]
+                                results_by_ticker[ticker] = future.result()
+                                status_text.text(f"🔍 Analyzed {ticker} ({i+1}/{len(tickers_to_analyze)})")
+                                progress_bar.progress((i + 1) / len(tickers_to_analyze))
+                        
+                        analysis_results = [results_by_ticker[ticker] for ticker in tickers_to_analyze]
                         
-                        for i, ticker in enumerate(tickers_to_analyze):
-                            status_text.text(f"🔍 Analyzing {ticker}... ({i+1}/{len(tickers_to_analyze)})")
-                            
-                            # Actual SEC API analysis
-                            result = process_ticker_analysis(ticker, ticker_df)
-                            analysis_results.append(result)
-                            
-                            progress_bar.progress((i + 1) / len(tickers_to_analyze))
-                            
                         # Display results
                         status_text.text("✅ Analysis complete!")
                         
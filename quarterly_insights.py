@@ -11,15 +11,14 @@ from financials import (
     get_company_cik,
     get_company_facts,
     get_company_submissions,
+    get_sec_session,
     rate_limit,
     get_current_stock_price,
-    SEC_HEADERS,
     SEC_BASE_URL,
     openai_client
 )
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
-import requests
 import yfinance as yf
 
 # Configure Streamlit
@@ -316,7 +315,7 @@ def fetch_filing_html(cik, accession, primary_doc):
 
     rate_limit()
     try:
-        response = requests.get(url, headers=SEC_HEADERS, timeout=30)
+        response = get_sec_session().get(url, timeout=30)
         response.raise_for_status()
         return response.text
     except Exception as e:
@@ -1185,6 +1184,8 @@ def main():
         ticker_df = load_company_tickers()
 
     if ticker_df.empty:
+        # Don't keep the failed load for the rest of the day; the next rerun tries again
+        load_company_tickers.clear()
         st.error("Could not load SEC ticker database. Please check your internet connection.")
         return
 